@@ -9,14 +9,22 @@
 
 import warnings
 import numpy as np
-from scipy import optimize 
+from concurrent.futures import ThreadPoolExecutor
+from scipy import optimize
 from .dirichlet_multinomial import *
 
 MAX_ITER = 1000
 TOL = 1.0e-14
+# L-BFGS-B options : a small `maxcor` keeps the per-iteration cost linear in
+# the number of variables; `ftol`/`gtol` replace the former tiny `tol=TOL`
+# which forced many wasted line-search steps.
+MAX_CORR = 10
+FTOL = 1.0e-10
+GTOL = 1.0e-8
 BOUND_DIR = (1.0e-6, 1.0e4)
 METHOD='L-BFGS-B'
 INIT_GUESS = 1.0
+N_RESTARTS = 3
 CUTOFFRATIO = 5 # FIXME this can be an option
 # Warning : CUTOFFRATIO > 1 
 USE_JAC_OPT = True
@@ -36,37 +44,76 @@ _PRIOR_CHOICE = {
 ########################################
 
 class BetaMultivariate_symmDir( ) :
-    def __init__(self, K) : 
+    # instantiated inside the optimizer loops : slots avoid the per-instance
+    # __dict__ and make the attribute loads direct
+    __slots__ = ("K", "_K_sqr")
+    def __init__(self, K) :
         '''Multivariate Beta function normalization to symmetric Dirichlet distribution.'''
         self.K = K
+        self._K_sqr = K * K
     def log(self, a) :
         return self.K * LogGmm(a) - LogGmm(self.K * a)
     def log_jac(self, a) :
         return self.K * diGmm(a) - self.K * diGmm(self.K * a)
     def log_hess(self, a) :
-        return self.K * triGmm(a) - np.power(self.K, 2) * triGmm(self.K * a)
+        return self.K * triGmm(a) - self._K_sqr * triGmm(self.K * a)
 
 class Polya( ) :
-    def __init__(self, cpct_exp) : 
+    __slots__ = ("ce", "_K_sqr", "_nn_pos", "_ff_pos", "_ff_zero", "_a_coeff",
+                 "_memo_key", "_memo")
+    def __init__(self, cpct_exp) :
         '''Polya distribution or symmetric-Dirichlet-multinomial distribution.'''
         self.ce = cpct_exp
+        self._K_sqr = self.ce.K * self.ce.K
+        # zero-count categories (at most the first row of the histogram) enter
+        # the sums only through f(a) : keep them out of the polygamma arrays
+        gtr0mask = self.ce.nn > 0
+        self._nn_pos = self.ce.nn[gtr0mask]
+        self._ff_pos = self.ce.ff[gtr0mask]
+        self._ff_zero = self.ce.ff[~gtr0mask].sum()
+        # coefficient of the f(a) term once the symmetric-Dirichlet Beta
+        # normalization K*f(a) - f(K*a) is folded into the closed form
+        self._a_coeff = self._ff_zero - self.ce.K
+        self._memo_key = None
+        self._memo = {}
+    def _polygamma_terms(self, func, a) :
+        '''(internal) Memoized `func` on the evaluation points `nn + a`, `N + K*a`,
+        `K*a` and `a`. The optimizer evaluates value, gradient and Hessian at the
+        same point `a` : a single-slot cache keyed on `a` spares the repeated
+        polygamma evaluations.'''
+        a = np.asarray(a)
+        key = (a.shape, a.tobytes())
+        if key != self._memo_key :
+            self._memo_key = key
+            self._memo = {
+                "xvec" : np.add.outer(self._nn_pos, a),
+                "X" : self.ce.N + self.ce.K * a,
+                "Ka" : self.ce.K * a,
+                "a" : a,
+                }
+        if func not in self._memo :
+            self._memo[func] = tuple( func(self._memo[point]) for point in ("xvec", "X", "Ka", "a") )
+        return self._memo[func]
     def log(self, a) :
         '''logarithm'''
-        output = self.ce.ff.dot(LogGmm(np.add.outer(self.ce.nn, a)))
-        output -= LogGmm(self.ce.N + self.ce.K * a) 
-        output -= BetaMultivariate_symmDir(self.ce.K).log(a)                
+        loggmm_xvec, loggmm_X, loggmm_Ka, loggmm_a = self._polygamma_terms(LogGmm, a)
+        output = self._ff_pos.dot(loggmm_xvec)
+        output += self._a_coeff * loggmm_a
+        output += loggmm_Ka - loggmm_X
         return output
     def log_jac(self, a) :
         '''1st derivative of the logarithm'''
-        output = self.ce.ff.dot(diGmm(np.add.outer(self.ce.nn, a))) 
-        output -= self.ce.K * diGmm(self.ce.N + self.ce.K * a) 
-        output -= BetaMultivariate_symmDir(self.ce.K).log_jac(a)                   
+        digmm_xvec, digmm_X, digmm_Ka, digmm_a = self._polygamma_terms(diGmm, a)
+        output = self._ff_pos.dot(digmm_xvec)
+        output += self._a_coeff * digmm_a
+        output += self.ce.K * (digmm_Ka - digmm_X)
         return output
     def log_hess(self, a) :
         '''2nd derivative of the logarithm'''
-        output = self.ce.ff.dot(triGmm(np.add.outer(self.ce.nn, a))) 
-        output -= np.power(self.ce.K, 2) * triGmm(self.ce.N + self.ce.K * a) 
-        output -= BetaMultivariate_symmDir(self.ce.K).log_hess(a)     
+        trigmm_xvec, trigmm_X, trigmm_Ka, trigmm_a = self._polygamma_terms(triGmm, a)
+        output = self._ff_pos.dot(trigmm_xvec)
+        output += self._a_coeff * trigmm_a
+        output += self._K_sqr * (trigmm_Ka - trigmm_X)
         return output
 
 #############################
@@ -75,29 +122,45 @@ class Polya( ) :
 
 class one_dim_metapr( ) :
     ''' Auxiliary class for transformation factor in determinant of the jacobian.'''
+    _drv_key = None
+
+    def drv_terms(self, order, a) :
+        '''Memoized derivative of given `order` of the a priori expected quantity.
+        The optimizer requests metaprior, jacobian and hessian of the logarithm
+        at the same point : a single-slot cache keyed on `a` computes each
+        derivative once, and is invalidated when the evaluation point changes.'''
+        a = np.asarray(a)
+        key = (a.shape, a.tobytes())
+        if key != self._drv_key :
+            self._drv_key = key
+            self._drv_memo = {}
+        if order not in self._drv_memo :
+            self._drv_memo[order] = getattr(self, "drv_%d" % order)(a)
+        return self._drv_memo[order]
+
     def metapr( self, a ) :
         '''factor of transformation Jacobian determinant (i.e abs of 1st derivative, NSB metaprior) '''
-        a = np.array(a).reshape(-1)
-        return self._sign * self.drv_1(a)
+        a = np.atleast_1d(np.asarray(a))
+        return self._sign * self.drv_terms(1, a)
     def metapr_jac(self, a) :
         '''1st derivative of the transformation factor.'''
-        a = np.array(a).reshape(-1)
-        return self._sign * self.drv_2(a)
+        a = np.atleast_1d(np.asarray(a))
+        return self._sign * self.drv_terms(2, a)
     def metapr_hess(self, a) :
         '''2nd derivative of the transformation factor.'''
-        a = np.array(a).reshape(-1)
-        return self._sign * self.drv_3(a)
+        a = np.atleast_1d(np.asarray(a))
+        return self._sign * self.drv_terms(3, a)
     def logmetapr(self, a) :
         '''logarithm of the transformation factor.'''
-        a = np.array(a).reshape(-1)
+        a = np.atleast_1d(np.asarray(a))
         return np.log(self.metapr(a))
     def logmetapr_jac(self, a) :
         '''1st derivative of the logarithm of the transformation factor.'''
-        a = np.array(a).reshape(-1)
+        a = np.atleast_1d(np.asarray(a))
         return self.metapr_jac(a) / self.metapr(a)
     def logmetapr_hess(self, a) :
         '''2nd derivative of the logarithm of the transformation factor.'''
-        a = np.array(a).reshape(-1)
+        a = np.atleast_1d(np.asarray(a))
         return self.metapr_hess(a) / self.metapr(a) - np.power(self.logmetapr_jac(a), 2)
 
 ###########################
@@ -128,26 +191,51 @@ class two_dim_metapr( ) :
                 except :
                     raise TypeError( "The parameter `scaling` should be a scalar." )
         self.use_phi = _PRIOR_CHOICE[self.choice]["use_phi"]
+        # cached constants for the hot metaprior evaluations
+        self._log_K = np.log(self.K)
+        self._cutoff = CUTOFFRATIO * self._log_K
+        self._dap_key = None
+        self._dap_memo = {}
+
+    def dap_terms(self, func_name, a, b) :
+        '''Memoized a priori divergence `func_name` in ("diverg_apriori",
+        "diverg_apriori_jac", "diverg_apriori_hess").
+        The metaprior methods and the phi helpers evaluate these at the same
+        point several times per optimizer iteration : a single-slot cache
+        keyed on `(a, b)` computes each of them once, and is invalidated as
+        soon as the evaluation point changes.'''
+        a = np.asarray(a)
+        b = np.asarray(b)
+        # note : the shape enters the key, so that a flat point and a broadcast
+        # grid over the same values do not share the cached arrays
+        key = (a.shape, a.tobytes(), b.shape, b.tobytes())
+        if key != self._dap_key :
+            self._dap_key = key
+            self._dap_memo = {}
+        if func_name not in self._dap_memo :
+            self._dap_memo[func_name] = getattr(self, func_name)(a, b)
+        return self._dap_memo[func_name]
 
     def metapr(self, var) :
         ''' Complete metaprior '''
         # pre-load variables
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
-        dap = self.diverg_apriori(a,b)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
+        dap = self.dap_terms("diverg_apriori", a, b)
 
         # contribution of the marginalization constraint phi
+        # note : without phi the first factor below allocates the output
         if self.use_phi is True :
             output = self.marginaliz_phi(a, b)
         else :
-            output = np.ones(shape = (np.size(dap),))
-        
+            output = 1.
+
         # contribution of the prior on the a priori expected divergence rho(D)
         if self.choice in ["scaled"] :
-            output *= np.exp(- self._extra["scaling"] * (dap / self.A.apriori(a)))
+            output = output * np.exp(- self._extra["scaling"] * (dap / self.A.apriori(a)))
         elif self.choice in ["uniform"] :
-            output[dap >= CUTOFFRATIO * np.log(self.K)] = NUMERICAL_ZERO
-            # NOTE : no point in adding the normalization 1. / (CUTOFFRATIO * np.log(self.K))
+            output[dap >= self._cutoff] = NUMERICAL_ZERO
+            # NOTE : no point in adding the normalization 1. / self._cutoff
         elif self.choice in ["log-uniform"] :
             output *= np.power(dap, - self._extra["scaling"])    
 
@@ -158,21 +246,22 @@ class two_dim_metapr( ) :
     def logmetapr( self, var ) :
         ''' logarithm of metaprior '''
         # pre-load variables
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
-        dap = self.diverg_apriori(a, b)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
+        dap = self.dap_terms("diverg_apriori", a, b)
 
         # contribution of the marginalization constraint phi
+        # note : without phi the first addend below allocates the output
         if self.use_phi is True :
             output = self.log_marginaliz_phi(a, b)
         else :
-            output = np.zeros(shape = (np.size(dap),))
+            output = 0.
 
         # contribution of the prior on the divergence log rho(D)
         if self.choice in ["scaled"] :
-            output -= self._extra["scaling"] * (dap / self.A.apriori(a))
+            output = output - self._extra["scaling"] * (dap / self.A.apriori(a))
         elif self.choice in ["uniform"] :
-            output[dap >= CUTOFFRATIO * np.log(self.K)] = - NUMERICAL_INFTY 
+            output[dap >= self._cutoff] = - NUMERICAL_INFTY 
 
         elif self.choice in ["log-uniform"] :
                 output -= self._extra["scaling"] * np.log(dap) 
@@ -181,13 +270,42 @@ class two_dim_metapr( ) :
         output += self.A.logmetapr(a) + self.B.logmetapr(b)
         return output
     
+    def logmetapr_grid( self, a, b ) :
+        '''Logarithm of the metaprior on the cartesian grid `a` x `b`.
+        The separable contributions are evaluated once per axis and only the
+        a priori divergence terms on the broadcast grid, so the polygamma work
+        scales with len(a) + len(b) instead of len(a) * len(b).'''
+        a = np.asarray(a).reshape(-1)
+        b = np.asarray(b).reshape(-1)
+        grid_a = a[:,np.newaxis]
+        grid_b = b[np.newaxis,:]
+        dap = self.dap_terms("diverg_apriori", grid_a, grid_b)
+
+        # contribution of the marginalization constraint phi
+        if self.use_phi is True :
+            output = self.log_marginaliz_phi(grid_a, grid_b)
+        else :
+            output = 0.
+
+        # contribution of the prior on the divergence log rho(D)
+        if self.choice in ["scaled"] :
+            output = output - self._extra["scaling"] * (dap / self.A.apriori(grid_a))
+        elif self.choice in ["uniform"] :
+            output = np.where(dap >= self._cutoff, - NUMERICAL_INFTY, output)
+        elif self.choice in ["log-uniform"] :
+            output -= self._extra["scaling"] * np.log(dap)
+
+        # contribution of the jacobian of the transformation
+        output += self.A.logmetapr(a)[:,np.newaxis] + self.B.logmetapr(b)[np.newaxis,:]
+        return output
+
     def logmetapr_jac( self, var ) :
         ''' Gradient of the logarihtm of metaprior '''
         # pre-load variables
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
-        dap = self.diverg_apriori(a, b)
-        dap_jac = self.diverg_apriori_jac(a, b)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
+        dap = self.dap_terms("diverg_apriori", a, b)
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
 
         # contribution of the marginalization constraint phi
         if self.use_phi is True :
@@ -197,12 +315,17 @@ class two_dim_metapr( ) :
 
         # contribution of the prior on the divergence rho
         if self.choice in ["scaled"] :
-            output[:, 0] -= self._extra["scaling"] * (dap_jac[:,0] - dap * self.A.drv_1(a) / self.A.apriori(a))  / self.A.apriori(a)
-            output[:, 1] -= self._extra["scaling"] * dap_jac[:,1] / self.A.apriori(a)
+            # evaluate the shared metaprior pieces once
+            apr_A = self.A.apriori(a)
+            drv1_A = self.A.drv_1(a)
+            output[:, 0] -= self._extra["scaling"] * (dap_jac[:,0] - dap * drv1_A / apr_A) / apr_A
+            output[:, 1] -= self._extra["scaling"] * dap_jac[:,1] / apr_A
         elif self.choice in ["uniform"] :
-            mask = dap < np.log(self.K)
-            output[ ~mask,: ] = NUMERICAL_ZERO
-            output[ dap >= CUTOFFRATIO * np.log(self.K),: ] = - NUMERICAL_INFTY
+            # indices are computed once and reused for the row assignments
+            idx_flat = np.flatnonzero( dap >= self._log_K )
+            idx_cut = np.flatnonzero( dap >= self._cutoff )
+            output[ idx_flat,: ] = NUMERICAL_ZERO
+            output[ idx_cut,: ] = - NUMERICAL_INFTY
         elif self.choice in ["log-uniform"] :
             output[:, 0] -= self._extra["scaling"] * dap_jac[:,0] / dap
             output[:, 1] -= self._extra["scaling"] * dap_jac[:,1] / dap
@@ -215,11 +338,11 @@ class two_dim_metapr( ) :
     def logmetapr_hess( self, var ) :
         ''' Hessian of the logarihtm of metaprior '''
         # pre-load variables
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
-        dap = self.diverg_apriori(a, b)
-        dap_jac = self.diverg_apriori_jac(a, b)
-        dap_hess = self.diverg_apriori_hess(a, b)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
+        dap = self.dap_terms("diverg_apriori", a, b)
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
+        dap_hess = self.dap_terms("diverg_apriori_hess", a, b)
 
         # contribution of the marginalization constraint phi
         if self.use_phi is True :
@@ -229,20 +352,27 @@ class two_dim_metapr( ) :
         
         # contribution of the prior on the divergence rho
         if self.choice in ["scaled"] :
-            tmp = dap_hess[:,0,0] * np.power( self.A.apriori(a), -1)
-            tmp -= 2 * dap_jac[:,0] * self.A.drv_1(a) * np.power( self.A.apriori(a), -2)
-            tmp += 2 * dap * np.power(self.A.drv_1(a), 2) * np.power( self.A.apriori(a), -3) 
-            tmp -= dap * self.A.drv_2(a) * np.power( self.A.apriori(a), -2) 
+            # evaluate the shared metaprior pieces once
+            apr_A = self.A.apriori(a)
+            drv1_A = self.A.drv_1(a)
+            inv_A = np.reciprocal(apr_A)
+            inv_A_sqr = inv_A * inv_A
+            tmp = dap_hess[:,0,0] * inv_A
+            tmp -= 2 * dap_jac[:,0] * drv1_A * inv_A_sqr
+            tmp += 2 * dap * np.power(drv1_A, 2) * inv_A_sqr * inv_A
+            tmp -= dap * self.A.drv_2(a) * inv_A_sqr
             output[:,0,0] -= self._extra["scaling"] * tmp
-            aux_sym = dap_hess[:,0,1] * np.power( self.A.apriori(a), -1) 
-            aux_sym -= dap_jac[:,1] * self.A.drv_1(a) * np.power( self.A.apriori(a), -2)
+            aux_sym = dap_hess[:,0,1] * inv_A
+            aux_sym -= dap_jac[:,1] * drv1_A * inv_A_sqr
             output[:,0,1] += self._extra["scaling"] * aux_sym
             output[:,1,0] += self._extra["scaling"] * aux_sym
-            output[:,1,1] -= self._extra["scaling"] * dap_hess[:,1,1] / self.A.apriori(a)
+            output[:,1,1] -= self._extra["scaling"] * dap_hess[:,1,1] / apr_A
         elif self.choice in ["uniform"] :
-            mask = dap < np.log(self.K)
-            output[ ~mask,:,: ] = NUMERICAL_ZERO
-            output[ dap >= CUTOFFRATIO * np.log(self.K),:,: ] = - NUMERICAL_INFTY
+            # indices are computed once and reused for the block assignments
+            idx_flat = np.flatnonzero( dap >= self._log_K )
+            idx_cut = np.flatnonzero( dap >= self._cutoff )
+            output[ idx_flat,:,: ] = NUMERICAL_ZERO
+            output[ idx_cut,:,: ] = - NUMERICAL_INFTY
         elif self.choice in ["log-uniform"] :
             output[:,0,0] -= self._extra["scaling"] * (dap_hess[:,0,0] / dap - np.power(dap_jac[:,0] / dap, 2))
             aux_sym = self._extra["scaling"] * (dap_hess[:,0,1] / dap - dap_jac[:,0] * dap_jac[:,1] / np.power(dap, 2)) 
@@ -259,31 +389,92 @@ class two_dim_metapr( ) :
 #  MAXIMUM A POSTERIORI  #
 # >>>>>>>>>>>>>>>>>>>>>>>>
 
-def minimize(myfunc, var, args=(), bounds=None, jac=None) :
-    '''General minimization wrapper for `myfunc`.'''
-    
-    if USE_JAC_OPT == False : jac = None
-    results = optimize.minimize(
+def minimize(myfunc, var, args=(), bounds=None, jac=None, n_restarts=1) :
+    '''General minimization wrapper for `myfunc`.
+
+    With `n_restarts` > 1 (and `bounds` given), the optimization is repeated from
+    further initial guesses log-spaced within the bounds and the best final
+    objective wins : a cheap guard against local minima and against the single
+    default guess saturating to the boundary.
+    '''
+
+    # note : when `jac` is True, `myfunc` returns the (value, gradient) pair
+    if (USE_JAC_OPT == False) and (jac is not True) : jac = None
+
+    x0 = np.asarray(var, dtype=float).reshape(-1)
+    guesses = [x0]
+    if (n_restarts > 1) and (bounds is not None) :
+        lo, hi = bounds[0]
+        extra = np.logspace(np.log10(lo), np.log10(hi), n_restarts + 1)[1:-1]
+        guesses += [np.full_like(x0, g) for g in extra]
+
+    best = None
+    for guess in guesses :
+        results = optimize.minimize(
+            myfunc,
+            x0=guess, args=args,
+            jac=jac,
+            method=METHOD, bounds=bounds,
+            options={'maxiter': MAX_ITER, 'maxcor': MAX_CORR, 'ftol': FTOL, 'gtol': GTOL}
+            )
+        if (best is None) or (results.fun < best.fun) :
+            best = results
+    if bounds is not None :
+        low, high = np.asarray(bounds, dtype=float).T
+        if np.any(np.abs(best.x - low) < TOL) or np.any(np.abs(best.x - high) < TOL) :
+            warnings.warn("The optimal parameter(s) saturated to the boundary.")
+    return best.x
+
+def minimize_1d( myfunc, args=(), bounds=BOUND_DIR ) :
+    '''Bounded (Brent) scalar minimization.
+    For one-dimensional problems the bracketing method needs fewer function
+    evaluations than L-BFGS-B and no gradient machinery at all.'''
+    results = optimize.minimize_scalar(
         myfunc,
-        x0=var, args=args,
-        jac=jac,
-        method=METHOD, bounds=bounds, 
-        options={'maxiter': MAX_ITER}, tol=TOL
+        args=args,
+        bounds=bounds, method="bounded",
+        options={'maxiter': MAX_ITER, 'xatol': TOL}
         )
-    '''
-    if np.any([ np.any(np.isclose(x, b, atol=TOL)) for x,b in zip(results.x, bounds) ]) :
-        warnings.warn("The optimal parameter(s) saturated to the boundary.")
-    '''
     return results.x
 
 def optimal_polya_param( cpct_exp ) :
     '''.'''
     # NOTE : this can be improved using the exact formula
-    def myfunc(var, *args) :
-        return - Polya(*args).log(var)
-    def myjac(var, *args) :
-        return - Polya(*args).log_jac(var)
-    return minimize(myfunc, [INIT_GUESS], args=(cpct_exp,), bounds=(BOUND_DIR,), jac=myjac)
+    # note : memoized on the compact experiment, which is immutable once
+    # built; sweeping estimators would re-run the same maximization otherwise
+    cached = getattr(cpct_exp, "_opt_polya_param", None)
+    if cached is not None :
+        return cached
+    polya = Polya(cpct_exp)
+    def myfunc(a) :
+        return - polya.log(a)
+    output = minimize_1d(myfunc, bounds=BOUND_DIR)
+    cpct_exp._opt_polya_param = output
+    return output
+
+def optimal_polya_param_pair( cpct_exp_1, cpct_exp_2 ) :
+    '''Optimal Polya parameters of two independent experiments.
+    The two maximizations share no state and the polygamma ufuncs release the
+    GIL, so they are run in parallel threads.'''
+    with ThreadPoolExecutor( max_workers=2 ) as executor :
+        job_1 = executor.submit( optimal_polya_param, cpct_exp_1 )
+        job_2 = executor.submit( optimal_polya_param, cpct_exp_2 )
+        return job_1.result(), job_2.result()
+
+def optimal_polya_param_batch( cpct_exp_list ) :
+    '''Optimal Polya parameter of each experiment in `cpct_exp_list`.
+    The joint objective is the sum of the per-experiment evidences, which is
+    separable in the stacked parameters : a single L-BFGS-B solve shares its
+    line searches and Python dispatch across all the problems instead of
+    paying one full solver run per experiment.'''
+    polya_list = [ Polya(cpct_exp) for cpct_exp in cpct_exp_list ]
+    def myfunc(var) :
+        values = [ polya.log(a) for polya, a in zip(polya_list, var) ]
+        jacs = [ polya.log_jac(a) for polya, a in zip(polya_list, var) ]
+        return - np.sum(values), - np.asarray(jacs, dtype=float)
+    init_guess = np.full( len(polya_list), INIT_GUESS )
+    bounds = ( BOUND_DIR, ) * len(polya_list)
+    return minimize(myfunc, init_guess, bounds=bounds, jac=True, n_restarts=N_RESTARTS)
 
 # >>>>>>>>>>>>>>>>>>>>>>>>>>>
 #  ONE dim meta likelihood  #
@@ -316,9 +507,12 @@ class one_dim_meta_likelihood( ) :
         hess_LogLike = self.dir_meta_obj.logmetapr_hess(a)
         hess_LogLike += self.polya.log_hess(a)
         return - hess_LogLike
+    def neglog_fused(self, a) :
+        '''Value and gradient pair, for minimization with `jac=True`.'''
+        return self.neglog(a), self.neglog_jac(a)
     def maximize(self, init_var) :
         '''.'''
-        return minimize( self.neglog, init_var, jac=self.neglog_jac, bounds=(BOUND_DIR,) )
+        return minimize( self.neglog_fused, init_var, jac=True, bounds=(BOUND_DIR,) )
 
     '''
     Negative log-meta-likelihood for maximization in logscale.
@@ -329,8 +523,11 @@ class one_dim_meta_likelihood( ) :
         return np.exp(lgscl_var) * self.neglog_jac(np.exp(lgscl_var)) - 1
     def lgscl_neglog_hess(self, lgscl_var) :
         return self.lgscl_neglog_jac(lgscl_var) + 1 + np.exp(2*lgscl_var) * self.neglog_hess(np.exp(lgscl_var))
+    def lgscl_neglog_fused(self, lgscl_var) :
+        '''Value and gradient pair, for minimization with `jac=True`.'''
+        return self.lgscl_neglog(lgscl_var), self.lgscl_neglog_jac(lgscl_var)
     def lgscl_maximize(self, init_var) :
-        return minimize(self.lgscl_neglog, init_var, jac=self.lgscl_neglog_jac, bounds=None )
+        return minimize(self.lgscl_neglog_fused, init_var, jac=True, bounds=None )
     '''
     Negative log-meta-likelihood for maximization in logscale.
     '''
@@ -359,11 +556,10 @@ class two_dim_meta_likelihood( ) :
 
     def neglog( self, var ) :
         '''Negative of the log-meta-likelihood.'''
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
         log_like = np.add.outer(self.polya_1.log(a), self.polya_2.log(b))
-        X, Y = np.meshgrid(a, b)
-        log_like += self.dir_meta_obj.logmetapr([X, Y]).reshape(len(a), len(b))
+        log_like += self.dir_meta_obj.logmetapr_grid(a, b)
         return - log_like
     def neglog_jac( self, var ) :
         '''Negative of the gradient of the log-meta-likelihood.'''
@@ -381,16 +577,19 @@ class two_dim_meta_likelihood( ) :
         hess_LogLike[:,0,0] += self.polya_1.log_hess( var[0] )
         hess_LogLike[:,1,1] += self.polya_2.log_hess( var[1] )
         return - hess_LogLike
+    def neglog_fused( self, var ) :
+        '''Value and gradient pair, for minimization with `jac=True`.'''
+        return self.neglog(var), self.neglog_jac(var)
     def maximize( self, init_var ) :
         '''.'''
-        return minimize( self.neglog, init_var, jac=self.neglog_jac, bounds=(BOUND_DIR,BOUND_DIR) )
+        return minimize( self.neglog_fused, init_var, jac=True, bounds=(BOUND_DIR,BOUND_DIR) )
     
     '''
     Negative log-meta-likelihood for maximization in logscale.
     '''
     def lgscl_neglog(self, var) :
-        a = np.array(var[0]).reshape(-1)
-        b = np.array(var[1]).reshape(-1)
+        a = np.asarray(var[0]).reshape(-1)
+        b = np.asarray(var[1]).reshape(-1)
         add_on = np.log(np.add.outer(a, b))
         return self.neglog(var) - add_on
     def lgscl_neglog_jac(self, var) :
@@ -413,8 +612,11 @@ class two_dim_meta_likelihood( ) :
         output[:,0,0] += jac[:,0] + 1.
         output[:,1,1] += jac[:,1] + 1.
         return output
+    def lgscl_neglog_fused( self, var ) :
+        '''Value and gradient pair, for minimization with `jac=True`.'''
+        return self.lgscl_neglog(var), self.lgscl_neglog_jac(var)
     def lgscl_maximize( self, init_var ) :
-        return minimize( self.lgscl_neglog, init_var, jac=self.lgscl_neglog_jac, bounds=((BOUND_DIR),)*2 )
+        return minimize( self.lgscl_neglog_fused, init_var, jac=True, bounds=((BOUND_DIR),)*2 )
 
 # <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 #   POSTERIOR STANDARD DEVIATION  #
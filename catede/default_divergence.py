@@ -13,8 +13,8 @@ from .dpm.kullback_leibler import main as _DKL_dpm_estimator
 from .dpm.squared_hellinger import main as _DH2_dpm_estimator
 from .dpm.symmetrized_KL import main as _symmDKL_dpm_estimator
 from .default_entropy import _unit_Dict_
-from .bayesian_calculus import optimal_polya_param
-from scipy.special import rel_entr
+from .bayesian_calculus import optimal_polya_param_pair
+from scipy.special import entr, rel_entr
 from .dirichlet_multinomial import D_diGmm
 
 _method_List_ = [
@@ -37,20 +37,54 @@ _which_List_ = ["squared-Hellinger", "Jensen-Shannon", "Kullback-Leibler", "symm
 
 def KullbackLeibler_oper(x, y) :
     ''' x * log(x/y) '''
-    return rel_entr(x, y)
+    # note : when x is close to y the ratio x/y loses the leading digits of
+    # the logarithm; the log1p form keeps small divergences accurate. The far
+    # branch goes through rel_entr, which returns 0 at x == 0 (reachable with
+    # a null concentration parameter) where 0 * log(0) would give nan.
+    delta = x - y
+    with np.errstate(divide="ignore", invalid="ignore") :
+        near = x * np.log1p(delta / y)
+    return np.where(np.abs(delta) < 0.5 * y, near, rel_entr(x, y))
 
 def symmetrized_KL_oper(x, y) :
-    ''' 0.5 * ( x * log(x/y) + y * log(y/x)) '''
-    return 0.5 * (rel_entr(x,y) + rel_entr(y,x))
+    ''' 0.5 * (x - y) * (log(x) - log(y)) '''
+    # note : equivalent to 0.5 * (rel_entr(x,y) + rel_entr(y,x)) for x,y > 0,
+    # with a single pair of logarithms and in-place updates of the output.
+    # At x == y == 0 the fused logs give inf - inf = nan where rel_entr gave
+    # 0 : fall back to it on the non-finite lanes.
+    with np.errstate(divide="ignore", invalid="ignore") :
+        output = np.log(x)
+        output -= np.log(y)
+        output *= x - y
+        output *= 0.5
+    return np.where(np.isfinite(output), output,
+                    0.5 * (rel_entr(x, y) + rel_entr(y, x)))
 
 def JensenShannon_oper(x, y) :
-    '''   '''
+    ''' entropy of the mixture minus the mean of the entropies '''
     mm = 0.5 * (x + y)
-    return 0.5 * (KullbackLeibler_oper(x, mm) + KullbackLeibler_oper(y, mm))
+    return entr(mm) - 0.5 * (entr(x) + entr(y))
 
 def Bhattacharyya_oper(x, y) :
     ''' sqrt( x * y ) '''
-    return np.sqrt(np.multiply(x, y)) 
+    output = np.multiply(x, y)
+    return np.sqrt(output, out=output)
+
+def _load_concentration_params(cpct_div, params) :
+    '''Validate the concentration parameters `params`, falling back to the
+    optimal Polya parameters of the two compact experiments when unspecified.'''
+    if np.any(np.array(params) == None) :
+        return optimal_polya_param_pair(cpct_div.compact_1, cpct_div.compact_2)
+    output = []
+    for param, name in zip(params, ("a", "b")) :
+        try:
+            param = np.float64(param)
+        except :
+            raise IOError(f'The concentration parameter `{name}` must be a scalar.')
+        if param < 0 :
+            raise IOError(f'The concentration parameter `{name}` must greater than 0.')
+        output.append(param)
+    return output
 
 #################
 #  SWITCHBOARD  #
@@ -122,6 +156,30 @@ def switchboard(cpct_div, method="naive", which="Kullback-Leibler", unit="defaul
     return unit_conv * divergence_estimate
 ###
 
+def compute_all(cpct_div, which="Kullback-Leibler", methods=None, unit="default") :
+    '''Estimate the divergence `which` with all the closed-form `methods` at once.
+
+    The optimal Polya parameter pair is fitted once up front, so every method
+    relying on it ("DP") reduces to a cached lookup; the compact object is
+    shared across the calls as well. The grid-based "DPM" estimator is not
+    included by default. Returns a dictionary {method : estimate}.
+    '''
+    if methods is None :
+        methods = ["naive", "Je", "La", "Tr", "Pe"]
+        if which in ["Kullback-Leibler", "symmetrized-KL"] :
+            methods.append("Zh")
+        if which not in ["Jensen-Shannon"] :
+            methods += ["DP", "DC"]
+    # fit the concentration parameters once : the caches on the compact
+    # experiments make the per-method fall-backs plain attribute reads
+    if ("DP" in methods) or ("max_evidence" in methods) :
+        optimal_polya_param_pair(cpct_div.compact_1, cpct_div.compact_2)
+    output = {}
+    for method in methods :
+        output[method] = switchboard(cpct_div, method=method, which=which, unit=unit)
+    return output
+###
+
 ###########
 #  NAIVE  #
 ###########
@@ -155,7 +213,7 @@ def naive(cpct_div, which="Kullback-Leibler") :
     else :
         raise IOError("Unknown method for the chosen divergence.")
 
-    return np.array( output )
+    return np.float64( output )
 
 
 #####################
@@ -190,7 +248,7 @@ def zhang( cpct_div, which="Kullback-Leibler", CPU_Count=None) :
     else :
         raise IOError("Unknown method for the chosen divergence.")
 
-    return np.array( output )
+    return np.float64( output )
 
 ##########################
 #  DIRICHLET ESTIMATOR  #
@@ -199,29 +257,21 @@ def zhang( cpct_div, which="Kullback-Leibler", CPU_Count=None) :
 def dirichlet_multinomial_pseudo_count( cpct_div, params=None, which="Kullback-Leibler"):
     '''Estimation of divergence with Dirichlet-multinomial pseudocount model.'''
     # check options
-    if np.any(np.array(params) == None) :
-        a = optimal_polya_param(cpct_div.compact_1)
-        b = optimal_polya_param(cpct_div.compact_2)
-    else :
-        try:
-            a = np.float64(params[0])
-        except :
-            raise IOError('The concentration parameter `a` must be a scalar.')
-        if a < 0 :
-            raise IOError('The concentration parameter `a` must greater than 0.')
-        try:
-            b = np.float64(params[1])
-        except :
-            raise IOError('The concentration parameter `b` must be a scalar.')
-        if b < 0 :
-            raise IOError('The concentration parameter `b` must greater than 0.')
+    a, b = _load_concentration_params(cpct_div, params)
 
-    # loading parameters from cpct_div 
+    # loading parameters from cpct_div
     N_1, N_2, K = cpct_div.N_1, cpct_div.N_2, cpct_div.K
     nn_1, nn_2, ff = cpct_div.nn_1, cpct_div.nn_2, cpct_div.ff
 
-    hh_1_a = (nn_1 + a) / (N_1 + K*a)     # frequencies with pseudocounts
-    hh_2_b = (nn_2 + b) / (N_2 + K*b)     # frequencies with pseudocounts
+    denom_1 = N_1 + K * a
+    denom_2 = N_2 + K * b
+    # identical pseudo-count maps on identical counts : the distributions
+    # coincide and every divergence below is exactly 0
+    if (a == b) and (denom_1 == denom_2) and np.array_equal(nn_1, nn_2) :
+        return np.float64( 0. )
+
+    hh_1_a = (nn_1 + a) / denom_1     # frequencies with pseudocounts
+    hh_2_b = (nn_2 + b) / denom_2     # frequencies with pseudocounts
 
     if which == "Jensen-Shannon" :
         output = ff.dot(JensenShannon_oper(hh_1_a, hh_2_b))
@@ -238,7 +288,7 @@ def dirichlet_multinomial_pseudo_count( cpct_div, params=None, which="Kullback-L
     else :
         raise IOError("Unknown method for the chosen quantity.")
 
-    return np.array( output )
+    return np.float64( output )
 ###
 
 
@@ -249,23 +299,8 @@ def dirichlet_multinomial_pseudo_count( cpct_div, params=None, which="Kullback-L
 def dirichlet_multinomial_expected_value(cpct_div, params=None, which="Kullback-Leibler", error=False,):
     '''Expected value of the divergence under Dirichlet-multinomial.'''
 
-    if np.any(np.array(params) == None) :
-        a = optimal_polya_param(cpct_div.compact_1)
-        b = optimal_polya_param(cpct_div.compact_2)
-    else :
-        try:
-            a = np.float64(params[0])
-        except :
-            raise IOError('The concentration parameter `a` must be a scalar.')
-        if a < 0 :
-            raise IOError('The concentration parameter `a` must greater than 0.')
-        try:
-            b = np.float64(params[1])
-        except :
-            raise IOError('The concentration parameter `b` must be a scalar.')
-        if b < 0 :
-            raise IOError('The concentration parameter `b` must greater than 0.')
-        
+    a, b = _load_concentration_params(cpct_div, params)
+
     if which == "Kullback-Leibler" :                               
         output = cpct_div.kullback_leibler(a, b)
         if error == True :
@@ -9,11 +9,11 @@
 '''
 
 import numpy as np
-from scipy.special import comb, entr
+from scipy.special import entr, xlogy
 from .bayesian_calculus import optimal_polya_param
 from .nsb.shannon import main as _shannon_nsb_est
 from .nsb.simpson import main as _simpson_nsb_est
-from .dirichlet_multinomial import D_diGmm
+from .dirichlet_multinomial import D_diGmm, LogGmm
 import warnings 
 
 _method_List_ = [
@@ -136,24 +136,23 @@ def switchboard( compExp, method="naive", which="Shannon", unit="default", **kwa
 def naive( compExp, which="Shannon" ):
     '''Entropy estimation (naive).'''
 
-    # loading parameters from compExp 
+    # loading parameters from compExp
     N = compExp.N
-    # delete 0 counts 
-    gtr0mask = compExp.nn > 0
-    nn, ff = compExp.nn[gtr0mask], compExp.ff[gtr0mask]
-
-    hh = nn / N
+    nn, ff = compExp.nn, compExp.ff
+    # note : both xlogy and the squared frequency vanish at nn == 0, so the
+    # zero counts need no masking nor slicing here
 
     if which == "Shannon" :
-        output = ff.dot(shannon_operator(hh))
+        # - sum ff * hh * log(hh) = log(N) - sum ff * nn * log(nn) / N
+        output = np.log(N) - ff.dot(xlogy(nn, nn)) / N
 
     elif which == "Simpson" :
-        output = ff.dot(simpson_operator(hh))
+        output = ff.dot(simpson_operator(nn / N))
 
     else :
         raise IOError("FIXME: place holder.")
 
-    return np.array( output )
+    return np.float64( output )
 ###
 
 ############################
@@ -177,7 +176,7 @@ def miller_madow( compExp, which="Shannon", ):
     else :
         raise IOError("FIXME: place holder.")
 
-    return np.array( output )
+    return np.float64( output )
 ###
 
 
@@ -205,7 +204,7 @@ def schurmann_grassberger(compExp, which="Shannon",):
     else :
         raise IOError("FIXME: place holder.")
 
-    return np.array(output)
+    return np.float64(output)
 ###
 
 #########################
@@ -227,8 +226,11 @@ def _good_turing_coverage(nn, ff) :
         # this correpsonds to the correction ff_1=N |==> ff_1=N-1
         GoodTuring = (N - 1) / N                                  
     else :
-        sign = np.power(-1, nn + 1)
-        binom = 1. / comb(N, nn)
+        # (-1)^(nn+1) : +1 for odd counts, -1 for even, via the parity bit
+        sign = 2 * (nn & 1) - 1
+        # 1 / comb(N, nn) through log-gamma : one vectorized call, no overflow
+        # of the intermediate binomial for large N
+        binom = np.exp(LogGmm(nn + 1) + LogGmm(N - nn + 1) - LogGmm(N + 1))
         GoodTuring = ff.dot(sign * binom)
         
     return 1. - GoodTuring
@@ -247,11 +249,13 @@ def chao_shen(compExp, which="Shannon"):
     mask = np.where(nn > 0)[0]
     nn, ff = nn[mask], ff[mask]        
    
-    # coverage adjusted empirical frequencies  
-    C = _good_turing_coverage(nn, ff)                       
-    p_vec = C * nn / N                         
-    # probability to see a bin (specie) in the sample         
-    lambda_vec = 1. - np.power(1. - p_vec, N)         
+    # coverage adjusted empirical frequencies
+    C = _good_turing_coverage(nn, ff)
+    p_vec = C * nn / N
+    # probability to see a bin (specie) in the sample
+    # note : -expm1(N * log1p(-p)) is 1 - (1-p)^N without the cancellation
+    # at small p, and replaces the generic power with log1p/expm1
+    lambda_vec = - np.expm1(N * np.log1p(- p_vec))
     
     if which == "Shannon" :
         output = ff.dot(shannon_operator(p_vec) / lambda_vec)
@@ -262,7 +266,7 @@ def chao_shen(compExp, which="Shannon"):
     else :
         raise IOError("FIXME: place holder.")
             
-    return np.array( output )
+    return np.float64( output )
 ###
 
 ##########################
@@ -305,7 +309,7 @@ def dirichlet_multinomial_pseudo_count(compExp, a=None, which="Shannon"):
     else :
         raise IOError("Unknown method for the chosen quantity.")
 
-    return np.array( output )
+    return np.float64( output )
 ###
 
 ##################
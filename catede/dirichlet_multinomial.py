@@ -9,31 +9,41 @@ import warnings
 import numpy as np
 import pandas as pd
 from numpy import outer
-from scipy.special import loggamma, polygamma
+from scipy.special import loggamma, psi, zeta
 
 # ########## #
 #  NOTATION  #
 # ########## #
 
-def LogGmm(x): 
+# note : scipy evaluates these in C and already switches to the asymptotic
+# (recurrence + Bernoulli) expansion for large arguments, so no Python-side
+# large-argument approximation is worthwhile here.
+# note : the `psi` and `zeta` ufuncs are called directly (with an optional
+# `out=` buffer) instead of going through the `scipy.special.polygamma`
+# wrapper, which broadcasts the order and allocates extra temporaries.
+# A compiled (Cython) polygamma loop was considered and rejected : it would
+# wrap the same Cephes routines scipy already exposes, for the price of a
+# build step in an otherwise pure-Python package.
+
+def LogGmm(x):
     ''' alias of Log Gamma function'''
-    return loggamma(x).real  
+    return loggamma(x).real
 
-def diGmm(x) :    
+def diGmm(x, out=None) :
     '''Digamma function (polygamma of order 0).'''
-    return polygamma(0, x)
+    return psi(x, out)
 
-def triGmm(x) :    
+def triGmm(x, out=None) :
     '''Trigamma function (polygamma of order 1).'''
-    return polygamma(1, x)
+    return zeta(2, x, out)
 
-def quadriGmm(x) :    
+def quadriGmm(x, out=None) :
     '''Quadrigamma function (polygamma of order 2).'''
-    return polygamma(2, x)
+    return np.multiply(zeta(3, x, out), -2., out=out)
 
-def quintiGmm(x) :    
+def quintiGmm(x, out=None) :
     '''Quintigamma function (polygamma of order 3).'''
-    return polygamma(3, x)
+    return np.multiply(zeta(4, x, out), 6., out=out)
 
 def D_diGmm(x, y):
     '''Difference between digamma functions in `x` and `y`.'''
@@ -104,9 +114,14 @@ class Experiment_Compact :
                 elif (is_div == 2) or (is_div == 'B') :                                       
                     self.Kobs = source.exp_2.obs_n_categ
                     self.N = source.exp_2.tot_counts                               
-                    self.nn = source.exp_2.counts_hist.index.values 
+                    self.nn = source.exp_2.counts_hist.index.values
                 else :
-                    raise IOError("Unrecognized identifier for `is_div`.")                
+                    raise IOError("Unrecognized identifier for `is_div`.")
+
+        # contiguous float64 multiplicities keep the ff.dot reductions on the
+        # BLAS fast path; the counts stay integer (the Good-Turing sign relies
+        # on integer parity)
+        self.ff = np.ascontiguousarray(self.ff, dtype=np.float64)
 
     ''' *** Save/Load *** '''
 
@@ -141,71 +156,74 @@ class Experiment_Compact :
 
     ''' *** Multidimensional Summations *** '''
 
-    def ffsum(self, sumGens, dim) :
-        return count_hist_sum_(self.ff, sumGens, dim)
+    def ffsum(self, sumTerms, dim) :
+        return count_hist_sum_(self.ff, sumTerms, dim)
 
-    def norm_ffsum(self, sumGens, a, dim, dimNorm=None) :
+    def norm_ffsum(self, sumTerms, a, dim, dimNorm=None) :
         '''Returns the normalization for the functions Omega.'''
         if dimNorm is None : dimNorm = dim
 
         X = self.K * a + self.N
         Norm = np.product(X * np.ones(dimNorm) + np.arange(0, dimNorm, 1))
-        return np.divide(self.ffsum(sumGens, dim), Norm)
+        return np.divide(self.ffsum(sumTerms, dim), Norm)
 
 
-    ''' *** Multivariate Beta Compound : Generators *** '''
+    ''' *** Multivariate Beta Compound : Addends *** '''
 
     def halfshift_i(self, a) :
         '''     sqrt(q_i)     '''
         xvec = self.nn + a
         X = self.N + self.K * a
 
-        yield np.exp(LogGmm(X) - LogGmm(X+0.5) - LogGmm(xvec) + LogGmm(xvec+0.5)) 
+        return (np.exp(LogGmm(X) - LogGmm(X+0.5) - LogGmm(xvec) + LogGmm(xvec+0.5)),)
 
     def halfshift_ij(self, a) :
         '''     sqrt(q_i) * sqrt(q_j)     '''
         xvec = self.nn + a
         X = self.N + self.K * a
 
-        # i == j
-        yield xvec
-
-        # i != j
-        yield outer(np.exp(LogGmm(xvec+0.5) - LogGmm(xvec)), np.exp(LogGmm(xvec+0.5) - LogGmm(xvec)))
+        return (
+            # i == j
+            xvec,
+            # i != j
+            outer(np.exp(LogGmm(xvec+0.5) - LogGmm(xvec)), np.exp(LogGmm(xvec+0.5) - LogGmm(xvec))),
+            )
 
     def shift_ii(self, a) :
         '''     q_i^2     '''
         xvec = self.nn + a
 
-        yield xvec * (xvec+1)
+        return (xvec * (xvec+1),)
 
     def shift_iijj(self, a) :
         '''     q_i^2 * q_j^2     '''
         xvec = self.nn + a
 
-        # i == j
-        yield xvec * (xvec+1) * (xvec+2) * (xvec+3)
-
-        # i != j
-        yield outer(xvec * (xvec+1), xvec * (xvec+1))
+        return (
+            # i == j
+            xvec * (xvec+1) * (xvec+2) * (xvec+3),
+            # i != j
+            outer(xvec * (xvec+1), xvec * (xvec+1)),
+            )
 
     def shift_i_deriv_i(self, a) :
         '''     q_i * ln(q_i)     '''
         xvec = self.nn + a
         X = self.N + self.K * a
 
-        yield xvec * D_diGmm(xvec+1, X+1) 
+        return (xvec * D_diGmm(xvec+1, X+1),)
 
     def shift_ij_deriv_ij(self, a) :
         '''     q_i * q_j * ln(q_i) * ln(q_j)     '''
         xvec = self.nn + a
         X = self.N + self.K * a
 
-        # i == j
-        yield xvec * (xvec+1) * (np.power(D_diGmm(xvec+2, X+2), 2) + D_triGmm(xvec+2, X+2))
-        
-        # i != j
-        yield outer(xvec, xvec) * (outer(D_diGmm(xvec+1, X+2), D_diGmm(xvec+1, X+2)) - triGmm(X+2))
+        return (
+            # i == j
+            xvec * (xvec+1) * (np.power(D_diGmm(xvec+2, X+2), 2) + D_triGmm(xvec+2, X+2)),
+            # i != j
+            outer(xvec, xvec) * (outer(D_diGmm(xvec+1, X+2), D_diGmm(xvec+1, X+2)) - triGmm(X+2)),
+            )
     
     ''' *** Methods *** '''
 
@@ -213,32 +231,32 @@ class Experiment_Compact :
         '''Expected Shannon entropy under Polya posterior.
             - sum_i < q_i * ln(q_i) | n ; a >
         '''
-        sumGens = self.shift_i_deriv_i(a)
-        sum_value = - self.norm_ffsum(sumGens, a, dim=1)
+        sumTerms = self.shift_i_deriv_i(a)
+        sum_value = - self.norm_ffsum(sumTerms, a, dim=1)
         return sum_value
 
     def squared_shannon(self, a) :
         '''Expected squared Shannon entropy under Polya posterior.
             sum_ij < q_i * q_j * ln(q_i) * ln(q_j) | n ; a > 
         '''
-        sumGens = self.shift_ij_deriv_ij(a)
-        sum_value = self.norm_ffsum(sumGens, a, dim=2)
+        sumTerms = self.shift_ij_deriv_ij(a)
+        sum_value = self.norm_ffsum(sumTerms, a, dim=2)
         return sum_value
 
     def simpson(self, a) :
         '''Expected Simpson index under Polya posterior.
             sum_i < q_i^2 | n ; a > 
         '''
-        sumGens = self.shift_ii(a)
-        sum_value = self.norm_ffsum(sumGens, a, dim=1, dimNorm=2)
+        sumTerms = self.shift_ii(a)
+        sum_value = self.norm_ffsum(sumTerms, a, dim=1, dimNorm=2)
         return sum_value
 
     def squared_simpson(self, a) :
         '''Expected squared Simpson index under Polya posterior.
             sum_ij < q_i^2 * q_j^2 | n ; a >   
         '''
-        sumGens = self.shift_iijj(a)
-        sum_value = self.norm_ffsum(sumGens, a, dim=2, dimNorm=4)
+        sumTerms = self.shift_iijj(a)
+        sum_value = self.norm_ffsum(sumTerms, a, dim=2, dimNorm=4)
         return sum_value
 ###
 
@@ -267,6 +285,8 @@ class Divergence_Compact :
             self.ff = div.counts_hist.values                             # recurrency of counts
             self.compact_1 = Experiment_Compact(source=div, is_div=1)  # compact for Exp 1
             self.compact_2 = Experiment_Compact(source=div, is_div=2)  # compact for Exp 1
+        # see Experiment_Compact : float64 multiplicities, integer counts
+        self.ff = np.ascontiguousarray(self.ff, dtype=np.float64)
     
     def reverse(self) :
         '''Switch experiments within a Divergence_compact object.'''
@@ -314,7 +334,7 @@ class Divergence_Compact :
         self.compact_1 = Experiment_Compact(source=self, is_div=1, is_comp=True)
         self.compact_2 = Experiment_Compact(source=self, is_div=2, is_comp=True)
 
-    ''' *** Multivariate Beta Compound : Generators *** '''
+    ''' *** Multivariate Beta Compound : Addends *** '''
 
     def Q_shift_i_T_deriv_i(self, a, b):
         '''     q_i ln(t_i)     '''
@@ -322,7 +342,7 @@ class Divergence_Compact :
         yvec = self.nn_2 + b
         Y = self.N_2 + self.K * b
 
-        yield xvec * D_diGmm(yvec, Y) 
+        return (xvec * D_diGmm(yvec, Y),)
 
     def Q_shift_ij_T_deriv_ij(self, a, b):
         '''     q_i q_j ln(t_i) ln(t_j)     '''
@@ -330,11 +350,12 @@ class Divergence_Compact :
         yvec = self.nn_2 + b
         Y = self.N_2 + self.K * b
 
-        # i == j
-        yield xvec * (xvec+1) * (np.power(D_diGmm(yvec, Y), 2) + D_triGmm(yvec, Y))
-        
-        # i != j
-        yield outer(xvec, xvec) * (outer(D_diGmm(yvec, Y), D_diGmm(yvec, Y)) - triGmm(Y))
+        return (
+            # i == j
+            xvec * (xvec+1) * (np.power(D_diGmm(yvec, Y), 2) + D_triGmm(yvec, Y)),
+            # i != j
+            outer(xvec, xvec) * (outer(D_diGmm(yvec, Y), D_diGmm(yvec, Y)) - triGmm(Y)),
+            )
     
     def Q_shift_ij_Q_deriv_i_T_deriv_j(self, a, b):
         '''     q_i q_j ln(q_i) ln(t_j)     '''
@@ -343,11 +364,12 @@ class Divergence_Compact :
         yvec = self.nn_2 + b
         Y = self.N_2 + self.K * b
 
-        # i == j
-        yield xvec * (xvec+1) * D_diGmm(xvec+2, X+2) * D_diGmm(yvec, Y)
-        
-        # i != j
-        yield outer(xvec, xvec) * outer(D_diGmm(xvec+1, X+2), D_diGmm(yvec, Y))
+        return (
+            # i == j
+            xvec * (xvec+1) * D_diGmm(xvec+2, X+2) * D_diGmm(yvec, Y),
+            # i != j
+            outer(xvec, xvec) * outer(D_diGmm(xvec+1, X+2), D_diGmm(yvec, Y)),
+            )
 
     ''' *** Polya Posterior Methods *** '''
 
@@ -355,66 +377,66 @@ class Divergence_Compact :
         '''Expected Kullback-Leibler divergence under Polya posterior.
                 sum_i < q_i ln(q_i) - q_i ln(t_i) | n, m ; a, b > 
         '''
-        sumGens_QlogQ = self.compact_1.shift_i_deriv_i(a)
-        sumGens_QlogT = self.Q_shift_i_T_deriv_i(a, b)
-        gens = zip(sumGens_QlogQ, sumGens_QlogT)
-        sumGens = (QlogQ - QlogT for QlogQ, QlogT in gens)
+        sumTerms_QlogQ = self.compact_1.shift_i_deriv_i(a)
+        sumTerms_QlogT = self.Q_shift_i_T_deriv_i(a, b)
+        pairs = zip(sumTerms_QlogQ, sumTerms_QlogT)
+        sumTerms = tuple(QlogQ - QlogT for QlogQ, QlogT in pairs)
 
-        return self.compact_1.norm_ffsum(sumGens, a, dim=1)
+        return self.compact_1.norm_ffsum(sumTerms, a, dim=1)
 
     def squared_kullback_leibler(self, a, b) :
         '''Expected squared Kullback-Leibler divergence under Polya posterior.
             sum_ij < q_i q_j ln(q_i) ln(q_j) - 2 * < q_i q_j ln(q_i) ln(t_j) + q_i q_j ln(t_i) ln(t_j) | n, m ; a, b > 
         '''
 
-        sumGens_Q2logQ2 = self.compact_1.shift_ij_deriv_ij(a)
-        sumGens_Q2logQlogT = self.Q_shift_ij_Q_deriv_i_T_deriv_j(a, b)
-        sumGens_Q2logT2 = self.Q_shift_ij_T_deriv_ij(a, b)
-        gens = zip(sumGens_Q2logQ2, sumGens_Q2logQlogT, sumGens_Q2logT2)
-        sumGens = (Q2logQ2 - 2 * Q2logQlogT + Q2logT2 for Q2logQ2, Q2logQlogT, Q2logT2 in gens)
+        sumTerms_Q2logQ2 = self.compact_1.shift_ij_deriv_ij(a)
+        sumTerms_Q2logQlogT = self.Q_shift_ij_Q_deriv_i_T_deriv_j(a, b)
+        sumTerms_Q2logT2 = self.Q_shift_ij_T_deriv_ij(a, b)
+        triples = zip(sumTerms_Q2logQ2, sumTerms_Q2logQlogT, sumTerms_Q2logT2)
+        sumTerms = tuple(Q2logQ2 - 2 * Q2logQlogT + Q2logT2 for Q2logQ2, Q2logQlogT, Q2logT2 in triples)
 
-        return self.compact_1.norm_ffsum(sumGens, a, dim=2)
+        return self.compact_1.norm_ffsum(sumTerms, a, dim=2)
     
     def bhattacharyya(self, a, b) :
         '''Posterior Bhattacharyya coefficient estimator.
             sum_i < sqrt{q_i} sqrt{t_i} | n, m ; a, b > 
         '''
-        sumGens_Qh = self.compact_1.halfshift_i(a)
-        sumGens_Th = self.compact_2.halfshift_i(b)
-        gens = zip(sumGens_Qh, sumGens_Th)
-        sumGens = (Qh * Th for Qh, Th in gens)
+        sumTerms_Qh = self.compact_1.halfshift_i(a)
+        sumTerms_Th = self.compact_2.halfshift_i(b)
+        pairs = zip(sumTerms_Qh, sumTerms_Th)
+        sumTerms = tuple(Qh * Th for Qh, Th in pairs)
 
-        return  self.compact_1.ffsum(sumGens, dim=1)
+        return  self.compact_1.ffsum(sumTerms, dim=1)
 
     def squared_bhattacharyya(self, a, b) :
         '''Posterior Bhattacharyya coefficient estimator.
             sum_ij < sqrt{q_i} sqrt{q_j} sqrt{t_i} sqrt{t_j} | n, m ; a, b > 
         '''
-        sumGens_Qh2 = self.compact_1.halfshift_ij(a)
-        sumGens_Th2 = self.compact_2.halfshift_ij(b)
-        gens = zip(sumGens_Qh2, sumGens_Th2)
-        sumGens = (Qh2 * Th2 for Qh2, Th2 in gens)
+        sumTerms_Qh2 = self.compact_1.halfshift_ij(a)
+        sumTerms_Th2 = self.compact_2.halfshift_ij(b)
+        pairs = zip(sumTerms_Qh2, sumTerms_Th2)
+        sumTerms = tuple(Qh2 * Th2 for Qh2, Th2 in pairs)
         X = self.N_1 + self.K * a
         Y = self.N_2 + self.K * b
 
-        return np.divide(self.compact_1.ffsum(sumGens, dim=2), X * Y)
+        return np.divide(self.compact_1.ffsum(sumTerms, dim=2), X * Y)
     
 ################
 #  SUMMATIONS  #
 ################
 
-def count_hist_sum_(ff, sumGens, dim) :
+def count_hist_sum_(ff, sumTerms, dim) :
     ''' Summing methods for histograms of counts.'''
 
-    # (0,...) : all ==        
-    tmp1D = next(sumGens)
+    # (0,...) : all ==
+    tmp1D = sumTerms[0]
 
     if dim == 2 :
         # (0,1) : i!=j
-        tmp2D = next(sumGens)
+        tmp2D = sumTerms[1]
         # summing
-        tmp1D += tmp2D.dot(ff) - tmp2D.diagonal()
-    
-    output =tmp1D.dot(ff)
+        tmp1D = tmp1D + tmp2D.dot(ff) - tmp2D.diagonal()
+
+    output = tmp1D.dot(ff)
 
-    return output        
\ No newline at end of file
+    return output
\ No newline at end of file
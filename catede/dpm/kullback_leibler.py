@@ -18,7 +18,9 @@ from ..nsb.shannon import DirShannon
 class DirCrossEntr( one_dim_metapr ) :
     def __init__( self, K ) :
         '''Class for `a priori` expected crossentropy under symmetric Dirichlet prior.'''
-        self.K = K 
+        self.K = K
+        self._K_sqr = K * K
+        self._K_cub = self._K_sqr * K
         self._sign = -1
     def apriori( self, b ) :
         '''`a priori` expected cross-entropy.'''
@@ -28,10 +30,10 @@ class DirCrossEntr( one_dim_metapr ) :
         return self.K * triGmm(self.K * b) - triGmm(b)
     def drv_2( self, b ) :
         '''2nd derivative of the `a priori` expected crossentropy.'''
-        return np.power(self.K, 2) * quadriGmm(self.K * b) - quadriGmm(b)
+        return self._K_sqr * quadriGmm(self.K * b) - quadriGmm(b)
     def drv_3( self, b ) :
         '''3rd derivative of the `a priori` expected crossentropy.'''
-        return np.power(self.K, 3) * quintiGmm(self.K * b) - quintiGmm(b)
+        return self._K_cub * quintiGmm(self.K * b) - quintiGmm(b)
 
 ###################################
 #  EQUAL KL DIVERGENCE METAPRIOR  #
@@ -45,16 +47,20 @@ class equalDirKLdiv( one_dim_metapr ) :
         self._sign = 1
     def apriori( self, a ) :
         '''`a priori` expected (equal) KL divergence.'''
-        return self._cnst * np.power(a, -1)
+        return self._cnst * np.reciprocal(np.asarray(a, dtype=float))
     def drv_1( self, a ) :
         '''1st derivative of the `a priori` expected (equal) KL divergence.'''
-        return self._cnst * np.power(a, -2)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        return self._cnst * inv * inv
     def drv_2( self, a ) :
         '''2nd derivative of the `a priori` expected (equal) KL divergence.'''
-        return - 2 * self._cnst * np.power(a, -3)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        return - 2 * self._cnst * inv * inv * inv
     def drv_3( self, a ) :
         '''3rd derivative of the `a priori` expected (equal) KL divergence.'''
-        return 6 * self._cnst * np.power(a, -4)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        inv2 = inv * inv
+        return 6 * self._cnst * inv2 * inv2
 
 #############################
 #  KL DIVERGENCE METAPRIOR  #
@@ -75,7 +81,7 @@ class DirKLdiv( two_dim_metapr ) :
         return self.B.apriori(b) - self.A.apriori(a)
     def diverg_apriori_jac( self, a, b ):
         '''.'''
-        dap = self.diverg_apriori( a, b )
+        dap = self.dap_terms( "diverg_apriori", a, b )
         output = np.zeros( shape = (np.size(dap), 2,) )
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0] -= self.A.drv_1(a)
@@ -83,7 +89,7 @@ class DirKLdiv( two_dim_metapr ) :
         return output
     def diverg_apriori_hess( self, a, b ):
         '''.'''
-        dap = self.diverg_apriori( a, b )
+        dap = self.dap_terms( "diverg_apriori", a, b )
         output = np.zeros( shape = (np.size(dap), 2, 2,) )
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0,0] -= self.A.drv_2(a)
@@ -96,40 +102,32 @@ class DirKLdiv( two_dim_metapr ) :
 
     def marginaliz_phi( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        output = np.ones( shape = (np.size(dap),) )
-        mask = dap < np.log(self.K)
-        output[ mask ] /= dap[ mask ]
-        output[ ~mask ] /= np.log(self.K)
-        return output
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        return np.where( dap < self._log_K, np.reciprocal(dap), 1. / self._log_K )
     def log_marginaliz_phi( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        output = np.zeros( shape = (np.size(dap),) )
-        mask = dap < np.log(self.K) 
-        output[ mask ] -= np.log( dap[mask] )
-        output[ ~mask ] -= np.log( np.log(self.K ))
-        return output
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        return np.where( dap < self._log_K, - np.log(dap), - np.log(self._log_K) )
     def log_marginaliz_phi_jac( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        dap_jac = self.diverg_apriori_jac(a, b)
-        output = np.zeros( shape = np.shape(dap_jac))
-        mask = dap < np.log(self.K)
-        output[mask,0] -= (dap_jac[:,0] / dap)[mask]
-        output[mask,1] -= (dap_jac[:,1] / dap)[mask]
-        return output
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
+        # the jacobian is -dap_jac/dap below the saturation threshold, 0 above :
+        # a single np.where column replaces the masked scatter assignments
+        neg_inv = np.where( dap < self._log_K, - np.reciprocal(dap), 0. )
+        return dap_jac * neg_inv[:,np.newaxis]
     def log_marginaliz_phi_hess( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        dap_jac = self.diverg_apriori_jac(a, b)
-        dap_hess = self.diverg_apriori_hess(a, b)
-        output = np.zeros( shape = np.shape(dap_hess) )
-        mask = dap < np.log(self.K)
-        output[mask,0,0] -= (dap_hess[:,0,0] / dap - np.power(dap_jac[:,0] / dap, 2))[mask]
-        output[mask,0,1] -= (dap_jac[:,0] * dap_jac[:,1] * np.power(dap, -2))[mask]
-        output[mask,1,0] = output[mask,0,1]
-        output[mask,1,1] -= (dap_hess[:,1,1] / dap - np.power(dap_jac[:,1] / dap, 2))[mask]
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
+        dap_hess = self.dap_terms("diverg_apriori_hess", a, b)
+        inv = np.where( dap < self._log_K, np.reciprocal(dap), 0. )
+        jac_ratio = dap_jac * inv[:,np.newaxis]
+        output = np.empty( shape = np.shape(dap_hess) )
+        output[:,0,0] = np.power(jac_ratio[:,0], 2) - dap_hess[:,0,0] * inv
+        output[:,0,1] = - jac_ratio[:,0] * jac_ratio[:,1]
+        output[:,1,0] = output[:,0,1]
+        output[:,1,1] = np.power(jac_ratio[:,1], 2) - dap_hess[:,1,1] * inv
         return output
 
 ########################
@@ -18,23 +18,26 @@ class _Dir_Bhatt_auxfunc( one_dim_metapr ) :
     def __init__(self, K) :
         '''Class for `a priori` expected *** under symmetric Dirichlet prior.'''
         self.K = K
+        self._K_sqr = K * K
+        self._K_cub = self._K_sqr * K
+        self._half_log_K = 0.5 * np.log(K)
         self._sign = 1
-    def _log_auxfunc(self, x_i, X, K) :
-        return 0.5 * np.log(K) + LogGmm(x_i+0.5) - LogGmm(x_i) + LogGmm(X) - LogGmm(X+0.5)
+    def _log_auxfunc(self, x_i, X) :
+        return self._half_log_K + LogGmm(x_i+0.5) - LogGmm(x_i) + LogGmm(X) - LogGmm(X+0.5)
     def apriori(self, a) :
         '''`a priori` expected <aux_name>.'''
-        return np.exp(self._log_auxfunc(a, self.K * a, self.K))
+        return np.exp(self._log_auxfunc(a, self.K * a))
     def drv_1(self, a) :
         '''1st derivative of the `a priori` expected <aux_name>.'''
         tmp = self.K * D_diGmm(self.K * a, self.K * a + 0.5) - D_diGmm(a, a + 0.5)
         return tmp * self.apriori(a)
     def drv_2(self, a) :
         '''2nd derivative of the `a priori` expected <aux_name>.'''
-        tmp = np.power(self.K, 2) * D_triGmm(self.K * a, self.K * a + 0.5) - D_triGmm(a, a + 0.5)
+        tmp = self._K_sqr * D_triGmm(self.K * a, self.K * a + 0.5) - D_triGmm(a, a + 0.5)
         return  tmp * self.apriori(a) + np.power(self.metapr(a), 2) / self.apriori(a)
     def drv_3(self, a) :
         '''3rd derivative of the `a priori` expected <aux_name>.'''
-        tmp = np.power(self.K, 3) * D_quadriGmm(self.K * a, self.K * a + 0.5) - D_quadriGmm(a, a + 0.5)
+        tmp = self._K_cub * D_quadriGmm(self.K * a, self.K * a + 0.5) - D_quadriGmm(a, a + 0.5)
         tmp *= self.apriori(a)
         tmp += 2 * self.metapr_jac(a) * self.metapr(a) / self.apriori(a)
         tmp += - np.power(self.metapr(a) / self.apriori(a), 2)
@@ -60,7 +63,7 @@ class DirHelldiv( two_dim_metapr ) :
         return self.A.apriori(a) * self.B.apriori(b)
     def diverg_apriori_jac(self, a, b):
         '''.'''
-        dap = self.diverg_apriori(a, b)
+        dap = self.dap_terms("diverg_apriori", a, b)
         output = np.zeros(shape = (np.size(dap), 2,))
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0] += self.A.drv_1(a) * self.B.apriori(b)
@@ -68,7 +71,7 @@ class DirHelldiv( two_dim_metapr ) :
         return output
     def diverg_apriori_hess(self, a, b):
         '''.'''
-        dap = self.diverg_apriori(a, b)
+        dap = self.dap_terms("diverg_apriori", a, b)
         output = np.zeros(shape = (np.size(dap), 2, 2,))
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0,0] += self.A.drv_2(a) * self.B.apriori(b)
@@ -88,25 +91,28 @@ class DirHelldiv( two_dim_metapr ) :
         return np.exp(self.log_marginaliz_phi(a, b))
     def log_marginaliz_phi(self, a, b) :
         '''.'''
-        dap = self.diverg_apriori(a, b)
+        dap = self.dap_terms("diverg_apriori", a, b)
         return 2 * np.log(1 - dap) - np.log(dap) - np.log(2 - dap)
     def log_marginaliz_phi_jac( self, a, b ) : 
         '''.'''
-        dap = self.diverg_apriori(a, b)
-        dap_jac = self.diverg_apriori_jac(a, b)
+        dap = self.dap_terms("diverg_apriori", a, b)
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
         output = np.zeros( shape = np.shape(dap_jac) )
-        tmp = - 2 * np.power(1 - dap, -1) - np.power(dap, -1) + np.power(2 - dap, -1)
+        tmp = - 2 * np.reciprocal(1 - dap) - np.reciprocal(dap) + np.reciprocal(2 - dap)
         output[:,0] = tmp * dap_jac[:,0]
         output[:,1] = tmp * dap_jac[:,1]    
         return output
     def log_marginaliz_phi_hess(self, a, b) : 
         '''.'''
-        dap = self.diverg_apriori(a, b)
-        dap_jac = self.diverg_apriori_jac(a, b)
-        dap_hess = self.diverg_apriori_hess(a, b)
+        dap = self.dap_terms("diverg_apriori", a, b)
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
+        dap_hess = self.dap_terms("diverg_apriori_hess", a, b)
         output = np.zeros( shape = np.shape(dap_hess) )
-        tmp = - 2 * np.power(1 - dap, -1) - np.power(dap, -1) + np.power(2 - dap, -1)
-        tmp_2 = 2 * np.power(1 - dap, -2) + np.power(dap, -2) - np.power(2 - dap, -2)
+        tmp = - 2 * np.reciprocal(1 - dap) - np.reciprocal(dap) + np.reciprocal(2 - dap)
+        inv_1m = np.reciprocal(1 - dap)
+        inv_d = np.reciprocal(dap)
+        inv_2m = np.reciprocal(2 - dap)
+        tmp_2 = 2 * inv_1m * inv_1m + inv_d * inv_d - inv_2m * inv_2m
         output[:,0,0] = tmp * dap_hess[:,0,0] + tmp_2 * dap_jac[:,0]
         output[:,0,1] = dap_hess[:,1,0]
         output[:,1,0] = dap_hess[:,0,1]
@@ -23,16 +23,20 @@ class _sDKL_auxfunc( one_dim_metapr ) :
         self.cnst = (K - 1.) / K
     def apriori( self, a ) :
         '''`a priori` expected <aux_name>.'''
-        return self.cnst * np.power(a, -1)
+        return self.cnst * np.reciprocal(np.asarray(a, dtype=float))
     def drv_1( self, a ) :
         '''1st derivative of the `a priori` <aux_name>.'''
-        return - self.cnst * np.power(a, -2)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        return - self.cnst * inv * inv
     def drv_2( self, a ) :
         '''2nd derivative of the `a priori` <aux_name>.'''
-        return 2 * self.cnst * np.power(a, -3)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        return 2 * self.cnst * inv * inv * inv
     def drv_3( self, a ) :
         '''3rd derivative of the `a priori` <aux_name>.'''
-        return - 6 * self.cnst * np.power(a, -4)
+        inv = np.reciprocal(np.asarray(a, dtype=float))
+        inv2 = inv * inv
+        return - 6 * self.cnst * inv2 * inv2
 
 ##################################
 #  SYMM KL DIVERGENCE METAPRIOR  #
@@ -53,7 +57,7 @@ class DirSymmetrizedKLdiv( two_dim_metapr ) :
         return self.A.apriori(a) + self.B.apriori(b)
     def diverg_apriori_jac( self, a, b ):
         '''.'''
-        dap = self.diverg_apriori( a, b )
+        dap = self.dap_terms( "diverg_apriori", a, b )
         output = np.zeros( shape = (np.size(dap), 2,) )
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0] += self.A.drv_1(a)
@@ -61,7 +65,7 @@ class DirSymmetrizedKLdiv( two_dim_metapr ) :
         return output
     def diverg_apriori_hess( self, a, b ):
         '''.'''
-        dap = self.diverg_apriori( a, b )
+        dap = self.dap_terms( "diverg_apriori", a, b )
         output = np.zeros( shape = (np.size(dap), 2, 2,) )
         # FIXME : can I predict dap shape just from a and b ?
         output[:,0,0] += self.A.drv_2(a)
@@ -74,31 +78,29 @@ class DirSymmetrizedKLdiv( two_dim_metapr ) :
 
     def marginaliz_phi( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        output = np.ones( shape = (np.size(dap),) ) / dap
-        return output
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        return np.reciprocal( dap )
     def log_marginaliz_phi( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        output = np.zeros( shape = (np.size(dap),) )
-        output -= np.log( dap )
-        return output
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        return - np.log( dap )
     def log_marginaliz_phi_jac( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        dap_jac = self.diverg_apriori_jac(a, b)
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
         output = np.zeros( shape = np.shape(dap_jac))
         output[:,0] -= (dap_jac[:,0] / dap)
         output[:,1] -= (dap_jac[:,1] / dap)
         return output
     def log_marginaliz_phi_hess( self, a, b ) :
         '''.'''
-        dap = self.diverg_apriori( a, b )
-        dap_jac = self.diverg_apriori_jac(a, b)
-        dap_hess = self.diverg_apriori_hess(a, b)
+        dap = self.dap_terms( "diverg_apriori", a, b )
+        dap_jac = self.dap_terms("diverg_apriori_jac", a, b)
+        dap_hess = self.dap_terms("diverg_apriori_hess", a, b)
         output = np.zeros( shape = np.shape(dap_hess) )
         output[:,0,0] -= (dap_hess[:,0,0] / dap - np.power(dap_jac[:,0] / dap, 2))
-        output[:,0,1] -= (dap_jac[:,0] * dap_jac[:,1] * np.power(dap, -2))
+        inv_dap = np.reciprocal(dap)
+        output[:,0,1] -= (dap_jac[:,0] * dap_jac[:,1] * inv_dap * inv_dap)
         output[:,1,0] = output[:,0,1]
         output[:,1,1] -= (dap_hess[:,1,1] / dap - np.power(dap_jac[:,1] / dap, 2))
         return output
@@ -91,6 +91,8 @@ class Skeleton_Class :
                 if categories < obs_n_categ :
                     warnings.warn("The parameter `categories` is set equal to the observed number of categories.")
         self._fix_zero_counts()
+        # changing the categories invalidates the cached compact object
+        self._cpct_cache = None
         pass
         
     def show( self ):
@@ -205,8 +207,11 @@ class Experiment( Skeleton_Class ) :
         return default_entropy.switchboard( self.compact(), which="Simpson", method=method, **kwargs )
     
     def compact( self ) :
-        '''It provides aliases for computations.'''
-        return Experiment_Compact( source=self )
+        '''It provides aliases for computations.
+        The compact object is built lazily and reused across estimator calls.'''
+        if getattr( self, "_cpct_cache", None ) is None :
+            self._cpct_cache = Experiment_Compact( source=self )
+        return self._cpct_cache
 
     def save_compact( self, filename ) :
         '''It saves the compact features of Experiment to `filename`.'''
@@ -291,10 +296,18 @@ class Divergence( Skeleton_Class ) :
     def squared_hellinger( self, method="naive", **kwargs ):
         '''Estimate the (squared) Hellinger divergence with a chosen `method`.'''
         return default_divergence.switchboard( self.compact(), method=method, which="squared-Hellinger", **kwargs )
-    
+
+    def compute_all( self, which="Kullback-Leibler", methods=None, unit="ln" ):
+        '''Estimate the divergence `which` with all the closed-form `methods` at once.'''
+        output = default_divergence.compute_all( self.compact(), which=which, methods=methods, unit=unit )
+        return pd.Series( output )
+
     def compact( self ) :
-        '''It provides aliases for computations.'''
-        return Divergence_Compact( self )
+        '''It provides aliases for computations.
+        The compact object is built lazily and reused across estimator calls.'''
+        if getattr( self, "_cpct_cache", None ) is None :
+            self._cpct_cache = Divergence_Compact( self )
+        return self._cpct_cache
 
     def save( self, filename, compression="gzip" ) : 
         '''It saves the Divergence object to `filename`.'''
@@ -14,6 +14,8 @@ class DirShannon( one_dim_metapr ) :
     def __init__( self, K ) :
         '''Class for `a priori` expected Shannon entropy under symmetric Dirichlet prior.'''
         self.K = K
+        self._K_sqr = K * K
+        self._K_cub = self._K_sqr * K
         self._sign = 1.
     def apriori(self, a) :
         '''`a priori` expected Shannon entropy.'''
@@ -23,10 +25,10 @@ class DirShannon( one_dim_metapr ) :
         return self.K * triGmm(self.K * a + 1) - triGmm(a + 1)
     def drv_2(self, a) :
         '''2nd derivative of the `a priori` expected Shannon entropy.'''
-        return np.power(self.K, 2) * quadriGmm(self.K * a + 1) - quadriGmm(a + 1)
+        return self._K_sqr * quadriGmm(self.K * a + 1) - quadriGmm(a + 1)
     def drv_3(self, a) :
         '''3rd derivative of the `a priori` expected Shannon entropy.'''
-        return np.power(self.K, 3) * quintiGmm(self.K * a + 1) - quintiGmm(a + 1)
+        return self._K_cub * quintiGmm(self.K * a + 1) - quintiGmm(a + 1)
 
 #####################
 #  ENTROPY WRAPPER  #
@@ -18,19 +18,27 @@ class DirSimpson( one_dim_metapr ) :
     def __init__( self, K ) :
         '''Class for `a priori` expected Simpson index under symmetric Dirichlet prior.'''
         self.K = K
+        self._K_sqr = K * K
+        self._K_cub = self._K_sqr * K
         self._sign = 1
     def apriori( self, a ) :
         '''`a priori` expected Simpson index.'''
-        return (self.K - 1) * np.power( self.K * a + 1, -2 )
+        inv = np.reciprocal( self.K * a + 1. )
+        return (self.K - 1) * inv * inv
     def drv_1( self, a ) :
         '''1st derivative of the `a priori` expected Simpson index.'''
-        return 2 * self.K * (self.K - 1) * np.power( self.K * a + 1, -3 )
+        inv = np.reciprocal( self.K * a + 1. )
+        return 2 * self.K * (self.K - 1) * inv * inv * inv
     def drv_2( self, a ) :
         '''2nd derivative of the `a priori` expected Simpson index.'''
-        return - 6 * np.power(self.K, 2) * (self.K - 1) * np.power(self.K * a + 1, -4)
+        inv = np.reciprocal( self.K * a + 1. )
+        inv2 = inv * inv
+        return - 6 * self._K_sqr * (self.K - 1) * inv2 * inv2
     def drv_3( self, a ) :
         '''3rd derivative of the `a priori` expected Simpson index.'''
-        return 24 * np.power(self.K, 3) * (self.K -1) * np.power(self.K * a + 1, -5)
+        inv = np.reciprocal( self.K * a + 1. )
+        inv2 = inv * inv
+        return 24 * self._K_cub * (self.K -1) * inv2 * inv2 * inv
 
 #####################
 #  ENTROPY WRAPPER  #